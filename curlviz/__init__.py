@@ -1,5 +1,6 @@
-from .sheet import Team, Stone, Sheet
-from .stream import Stream, PDF, SVG, PNG
+from .sheet import Team, Stone, Trajectory, Sheet
+from .stream import Stream, PDF, MultiPagePDF, SVG, PNG, MultiFormat
+from .stream import Sink, DirectorySink, ZipSink, TarSink
 from .config import Config, Colors
 from . import consts
 
@@ -9,6 +10,7 @@ __all__ = [
     # Sheet state
     "Team",
     "Stone",
+    "Trajectory",
     "Sheet",
     # Configuration
     "Config",
@@ -16,6 +18,13 @@ __all__ = [
     # Streams
     "Stream",
     "PDF",
+    "MultiPagePDF",
     "SVG",
     "PNG",
+    "MultiFormat",
+    # Output sinks
+    "Sink",
+    "DirectorySink",
+    "ZipSink",
+    "TarSink",
 ]
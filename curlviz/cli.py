@@ -23,39 +23,59 @@ def show_config(args: argparse.Namespace) -> None:
                 print_config(fs)
 
 
+def parse_config(filename: str | None) -> curlviz.Config:
+    if filename is None:
+        return curlviz.Config()
+    with open(filename, "r") as fs:
+        dict = json.load(fs)
+        return curlviz.Config(**dict)
+
+
+def parse_sheet(filename: str) -> curlviz.Sheet:
+    sheet = curlviz.Sheet()
+    with open(filename, "r") as fs:
+        dict = json.load(fs)
+        for stone in dict["stones"]:
+            sheet.put(curlviz.Stone(**stone))
+        for trajectory in dict.get("trajectories", []):
+            sheet.trace(curlviz.Trajectory(**trajectory))
+    return sheet
+
+
 def export_image(args: argparse.Namespace) -> None:
-    def parse_config(filename: str | None):
-        if filename is None:
-            return curlviz.Config()
-        with open(filename, "r") as fs:
-            dict = json.load(fs)
-            return curlviz.Config(**dict)
-
-    def parse_sheet(filename: str) -> curlviz.Sheet:
-        sheet = curlviz.Sheet()
-        with open(filename, "r") as fs:
-            dict = json.load(fs)
-            for stone in dict["stones"]:
-                sheet.put(curlviz.Stone(**stone))
-        return sheet
-
-    output = args.filename if args.output is None else args.output
-    target = args.format if args.output is None else path.splitext(args.output)[1][1:]
+    if args.output is not None and len(args.filenames) > 1:
+        raise RuntimeError("Output filename cannot be set for multiple JSON files.")
 
     config = parse_config(args.config)
-    sheet = parse_sheet(args.filename)
-    stream: curlviz.stream.Stream = None
-    match target:
-        case "pdf":
-            stream = curlviz.stream.PDF(output, config)
-        case "svg":
-            stream = curlviz.stream.SVG(output, config)
-        case "png":
-            stream = curlviz.stream.PNG(output, config)
-        case _:
-            msg = f"Unknown target: {target}"
-            raise RuntimeError(msg)
-    stream.export(sheet)
+    sink = None if args.output_archive is None else curlviz.stream.archive(args.output_archive)
+    try:
+        for filename in args.filenames:
+            output = filename if args.output is None else args.output
+            target = args.format if args.output is None else path.splitext(args.output)[1][1:]
+
+            sheet = parse_sheet(filename)
+            stream: curlviz.stream.Stream = None
+            match target:
+                case "pdf":
+                    stream = curlviz.stream.PDF(output, config, sink)
+                case "svg":
+                    stream = curlviz.stream.SVG(output, config, sink)
+                case "png":
+                    stream = curlviz.stream.PNG(output, config, sink)
+                case _:
+                    msg = f"Unknown target: {target}"
+                    raise RuntimeError(msg)
+            stream.export(sheet)
+    finally:
+        if sink is not None:
+            sink.close()
+
+
+def export_report(args: argparse.Namespace) -> None:
+    config = parse_config(args.config)
+    with curlviz.stream.MultiPagePDF(args.output, config) as stream:
+        for filename in args.filenames:
+            stream.export(parse_sheet(filename))
 
 
 def main() -> None:
@@ -80,8 +100,10 @@ def main() -> None:
         help="Export sheet image with given stones",
     )
     export_command.add_argument(
-        "filename",
-        help="JSON file of stone positions",
+        "filenames",
+        nargs="+",
+        metavar="filename",
+        help="JSON files of stone positions",
     )
     export_command.add_argument(
         "-o",
@@ -101,8 +123,36 @@ def main() -> None:
         default="pdf",
         help="Set output format",
     )
+    export_command.add_argument(
+        "--output-archive",
+        default=None,
+        help="Write all exported files into a single archive (.zip, .tar, .tar.gz or .tgz)",
+    )
     export_command.set_defaults(handler=export_image)
 
+    report_command = command_group.add_parser(
+        "report",
+        help="Export a multi-page PDF with one page per JSON file",
+    )
+    report_command.add_argument(
+        "filenames",
+        nargs="+",
+        help="JSON files of stone positions, one per page",
+    )
+    report_command.add_argument(
+        "-o",
+        "--output",
+        default="report.pdf",
+        help="Set output filename",
+    )
+    report_command.add_argument(
+        "-c",
+        "--config",
+        default=None,
+        help="Set configuration file",
+    )
+    report_command.set_defaults(handler=export_report)
+
     args = parser.parse_args()
     if hasattr(args, "handler"):
         args.handler(args)
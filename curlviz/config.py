@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+import math
 import re
 
 from curlviz.consts import default
@@ -52,15 +53,26 @@ class Config:
     Attributes:
         inversion (bool): draw the sheet up-side down if `True` (default: `False`)
         full (bool): [currently no-effect] draw the entire sheet if `True` (default: `False`)
+        viewport (str | list[float] | None): draw only `"house"` or a rectangle `[x_min, y_min, x_max, y_max]`
+            in sheet coordinates if given, overriding `full` and `sheet_width` (default: `None`)
         ppm (int): pixels per meter (default: `20`)
         sheet_width (float): sheet width (default: `4.75` m)
+        trajectory_width (float): stroke width of stone trajectories (default: `0.02` m)
+        trajectory_tolerance (float): tolerance to simplify stone trajectories (default: `0.5` px)
+        draft (bool): draw a fast preview without anti-aliasing and stone borders if `True` (default: `False`)
+        draft_scale (float): scale of `ppm` applied in draft mode (default: `1.0`)
         colors (Colors): drawing colors
     """
 
     inversion: bool = False
     full: bool = False
+    viewport: str | list[float] | None = None
     ppm: int = default.PPM
     sheet_width: float = default.SHEET_WIDTH
+    trajectory_width: float = default.TRAJECTORY_WIDTH
+    trajectory_tolerance: float = default.TRAJECTORY_TOLERANCE
+    draft: bool = False
+    draft_scale: float = 1.0
     colors: Colors = field(default_factory=lambda: Colors())
 
     def __post_init__(self):
@@ -68,11 +80,41 @@ class Config:
         #     raise Warning(
         #         f"Configuration `full` currently has no-effect, set it `False` to suppress this warning."
         #     )
+        viewport_error = ValueError(
+            f"Viewport must be 'house' or [x_min, y_min, x_max, y_max] of a non-empty rectangle, but got {self.viewport}."
+        )
+        match self.viewport:
+            case None | "house":
+                pass
+            case [_, _, _, _]:
+                try:
+                    x_min, y_min, x_max, y_max = [float(v) for v in self.viewport]
+                except (TypeError, ValueError):
+                    raise viewport_error from None
+                if not all(math.isfinite(v) for v in (x_min, y_min, x_max, y_max)):
+                    raise viewport_error
+                if not (x_min < x_max and y_min < y_max):
+                    raise viewport_error
+                self.viewport = [x_min, y_min, x_max, y_max]
+            case _:
+                raise viewport_error
         if self.ppm <= 0:
             raise ValueError(f"PPM must be a positive integer, but got {self.ppm}.")
         if self.sheet_width <= 0:
             raise ValueError(
                 f"Sheet width must be positive, but got {self.sheet_width}."
             )
+        if self.trajectory_width <= 0:
+            raise ValueError(
+                f"Trajectory width must be positive, but got {self.trajectory_width}."
+            )
+        if self.trajectory_tolerance < 0:
+            raise ValueError(
+                f"Trajectory tolerance must be non-negative, but got {self.trajectory_tolerance}."
+            )
+        if not 0 < self.draft_scale <= 1:
+            raise ValueError(
+                f"Draft scale must be in (0, 1], but got {self.draft_scale}."
+            )
         if isinstance(self.colors, dict):
             self.colors = Colors(**self.colors)
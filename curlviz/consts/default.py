@@ -14,6 +14,19 @@ Regulation:
 """
 SHEET_WIDTH: float = 4.750
 
+"""Default trajectory width
+
+This is the default width of the stroke to draw stone trajectories (unit: meter).
+"""
+TRAJECTORY_WIDTH: float = 0.02
+
+"""Default trajectory tolerance
+
+This is the default tolerance to simplify stone trajectories (unit: pixel).
+Every point of a trajectory is drawn within this tolerance of its original position.
+"""
+TRAJECTORY_TOLERANCE: float = 0.5
+
 """Default background color
 
 This is the default color to fill the background of the sheet.
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+import dataclasses
 import math
 
 import skia
@@ -29,24 +31,62 @@ class Drawer:
         """
         self.config = config
 
+    @property
+    def ppm(self) -> float:
+        """Effective pixels per meter
+
+        This is `ppm` given by the configuration, reduced by `draft_scale` in draft mode.
+        """
+        if self.config.draft:
+            return self.config.ppm * self.config.draft_scale
+        return self.config.ppm
+
+    def viewport(self) -> tuple[float, float, float, float]:
+        """Returns the visible area of the sheet
+
+        The visible area is given as `(x_min, y_min, x_max, y_max)` in sheet coordinates.
+        If `viewport` of the configuration is `None`, the area depends on `full` flag:
+        it covers the entire sheet between hack-line and back-line if `full` flag is `True`,
+        otherwise it only covers the play area between hog-line to back-line.
+        If `viewport` is `"house"`, the area only covers the house.
+
+        Exceptions:
+            This method raises a value error when `viewport` of the configuration is invalid.
+        """
+        margin = 2 * consts.STONE_RADIUS
+        match self.config.viewport:
+            case None:
+                half_width = self.config.sheet_width / 2.0
+                y_min = -margin if self.config.full else consts.HOG_LINE - margin
+                return (-half_width, y_min, half_width, consts.BACK_LINE + margin)
+            case "house":
+                radius = consts.HOUSE_RADII[-1] + margin
+                return (-radius, consts.TEE_LINE - radius, radius, consts.TEE_LINE + radius)
+            case (x_min, y_min, x_max, y_max):
+                return (x_min, y_min, x_max, y_max)
+            case _:
+                raise ValueError(
+                    f"Viewport must be 'house' or [x_min, y_min, x_max, y_max] of a non-empty rectangle, but got {self.config.viewport}."
+                )
+
     def canvas_size(self) -> tuple[int, int]:
         """Returns canvas size
 
-        The canvas size basically depends on `sheet_width` and `ppm` given by the configuration.
-        If `full` flag is `True`, the canvas covers the entire sheet between hack-line and back-line,
-        otherwise it only covers the play area between hog-line to back-line.
+        The canvas size basically depends on the viewport and `ppm` given by the configuration.
+        In draft mode, `ppm` is reduced by `draft_scale`.
+        By default, the viewport depends on `sheet_width` and `full` flag, see `viewport()` for details.
         """
-        ppm = self.config.ppm
-        width = ppm * self.config.sheet_width
-        if self.config.full:
-            height = ppm * (consts.BACK_LINE + 4 * consts.STONE_RADIUS)
-        else:
-            height = ppm * (consts.BACK_LINE - consts.HOG_LINE + 4 * consts.STONE_RADIUS)
+        ppm = self.ppm
+        x_min, y_min, x_max, y_max = self.viewport()
+        width = ppm * (x_max - x_min)
+        height = ppm * (y_max - y_min)
         return (math.ceil(width), math.ceil(height))
 
     def draw(self, canvas: skia.Canvas, sheet: Sheet) -> None:
         """Draws the sheet on the given canvas
 
+        Only the objects in the viewport are drawn.
+
         Arguments:
             canvas (skia.Canvas): the canvas to draw a sheet
             sheet (curlviz.Sheet): the sheet to be drawn
@@ -59,12 +99,14 @@ class Drawer:
             canvas.translate(0, height)
             canvas.scale(1, -1)
 
-        shift = skia.Point(
-            x=self.config.sheet_width / 2.0,
-            y=((0 if self.config.full else -consts.HOG_LINE) + 2 * consts.STONE_RADIUS),
-        )
+        x_min, y_min, x_max, y_max = self.viewport()
+        shift = skia.Point(x=-x_min, y=-y_min)
+
+        def visible(left: float, bottom: float, right: float, top: float) -> bool:
+            return left <= x_max and x_min <= right and bottom <= y_max and y_min <= top
 
-        ppm = self.config.ppm
+        ppm = self.ppm
+        anti_alias = not self.config.draft
         line_width = consts.LINE_WIDTH * ppm
 
         background_color = skia.Color(*color_code_to_rgb(self.config.colors.background))
@@ -92,16 +134,19 @@ class Drawer:
             outer_house_color,
         ]
         circle_center = skia.Point(0, consts.TEE_LINE) + shift
-        for radius, color in zip(reversed(consts.HOUSE_RADII), reversed(circle_colors), strict=True):
-            canvas.drawCircle(
-                center=circle_center * ppm,
-                radius=radius * ppm,
-                paint=skia.Paint(Color=color, Style=skia.Paint.kFill_Style, AntiAlias=True),
-            )
+        house_radius = consts.HOUSE_RADII[-1]
+        if visible(-house_radius, consts.TEE_LINE - house_radius, house_radius, consts.TEE_LINE + house_radius):
+            for radius, color in zip(reversed(consts.HOUSE_RADII), reversed(circle_colors), strict=True):
+                canvas.drawCircle(
+                    center=circle_center * ppm,
+                    radius=radius * ppm,
+                    paint=skia.Paint(Color=color, Style=skia.Paint.kFill_Style, AntiAlias=anti_alias),
+                )
 
         # draw lines
         pen = skia.Paint(Color=line_color, StrokeWidth=line_width)
-        canvas.drawLine((0 + shift.x()) * ppm, 0, (0 + shift.x()) * ppm, height, paint=pen)
+        if x_min <= 0 <= x_max:
+            canvas.drawLine((0 + shift.x()) * ppm, 0, (0 + shift.x()) * ppm, height, paint=pen)
         for line in [
             consts.HACK,
             consts.CENTER,
@@ -109,24 +154,60 @@ class Drawer:
             consts.TEE_LINE,
             consts.BACK_LINE,
         ]:
-            y = line + shift.y()
-            if y < 0:
+            if not y_min <= line <= y_max:
                 continue
+            y = line + shift.y()
             canvas.drawLine(0, y * ppm, width, y * ppm, paint=pen)
 
+        # draw trajectories, batched into a single path per team
+        tolerance = self.config.trajectory_tolerance / ppm
+        paths = [skia.Path() for _ in stone_colors]
+        for trajectory in sheet.trajectories:
+            if not trajectory.team.is_entity() or len(trajectory.points) < 2:
+                continue
+            if not visible(*trajectory.bounds()):
+                continue
+            points = trajectory.simplified(tolerance)
+            path = paths[trajectory.team]
+            path.moveTo((skia.Point(*points[0]) + shift) * ppm)
+            for point in points[1:]:
+                path.lineTo((skia.Point(*point) + shift) * ppm)
+        for path, color in zip(paths, stone_colors):
+            if path.isEmpty():
+                continue
+            canvas.drawPath(
+                path,
+                paint=skia.Paint(
+                    Color=color,
+                    Style=skia.Paint.kStroke_Style,
+                    StrokeWidth=self.config.trajectory_width * ppm,
+                    StrokeJoin=skia.Paint.kRound_Join,
+                    StrokeCap=skia.Paint.kRound_Cap,
+                    AntiAlias=anti_alias,
+                ),
+            )
+
         # draw stones
         for stone in sheet.stones:
             if not stone.team.is_entity():
                 continue
+            if self.config.viewport is None:
+                # stones behind the bottom edge are not drawn, even if partly visible
+                if stone.y < y_min:
+                    continue
+            else:
+                r = consts.STONE_RADIUS
+                if not visible(stone.x - r, stone.y - r, stone.x + r, stone.y + r):
+                    continue
             center = skia.Point(stone.x, stone.y) + shift
-            if center.y() < 0:
-                continue
             color = stone_colors[stone.team]
             canvas.drawCircle(
                 center=center * ppm,
                 radius=consts.STONE_RADIUS * ppm,
-                paint=skia.Paint(Color=color, Style=skia.Paint.kFill_Style, AntiAlias=True),
+                paint=skia.Paint(Color=color, Style=skia.Paint.kFill_Style, AntiAlias=anti_alias),
             )
+            if self.config.draft:
+                continue
             canvas.drawCircle(
                 center=center * ppm,
                 radius=(1.0 - consts.STONE_BORDER_RATIO / 2.0) * consts.STONE_RADIUS * ppm,
@@ -134,8 +215,33 @@ class Drawer:
                     Color=line_color,
                     Style=skia.Paint.kStroke_Style,
                     StrokeWidth=consts.STONE_BORDER_RATIO * consts.STONE_RADIUS * ppm,
-                    AntiAlias=True,
+                    AntiAlias=anti_alias,
                 ),
             )
 
         canvas.restore()
+
+    def render(self, sheet: Sheet) -> skia.Image:
+        """Renders the sheet into a raster image
+
+        Arguments:
+            sheet (curlviz.Sheet): the sheet to be drawn
+        """
+        surface = skia.Surface(*self.canvas_size())
+        with surface as canvas:
+            self.draw(canvas, sheet)
+        return surface.makeImageSnapshot()
+
+
+def render_progressive(sheet: Sheet, config: Config) -> Iterator[skia.Image]:
+    """Renders the sheet progressively
+
+    This generator yields a draft image first, and then the full-quality image.
+    The draft is rendered with `config` in draft mode, so `draft_scale` of `config` applies to it.
+
+    Arguments:
+        sheet (curlviz.Sheet): the sheet to be drawn
+        config (curlviz.Config): the configuration for the full-quality image
+    """
+    yield Drawer(dataclasses.replace(config, draft=True)).render(sheet)
+    yield Drawer(dataclasses.replace(config, draft=False)).render(sheet)
@@ -0,0 +1,52 @@
+def simplify(points: list[tuple[float, float]], tolerance: float) -> list[tuple[float, float]]:
+    """Simplifies a polyline within the given tolerance
+
+    The polyline is first thinned by dropping points closer than `tolerance / 2` to the previously kept point,
+    and then simplified by Ramer-Douglas-Peucker algorithm with the other half of the tolerance.
+    Both end points are always kept.
+
+    Arguments:
+        points (list[tuple[float, float]]): vertices of the polyline
+        tolerance (float): maximum distance between the original and the simplified polyline
+    """
+    if len(points) <= 2 or tolerance <= 0:
+        return list(points)
+
+    # radial distance thinning and Ramer-Douglas-Peucker share the tolerance,
+    # so that every original point is within `tolerance` of the simplified polyline
+    sq_tolerance = (tolerance / 2) ** 2
+    thinned = [points[0]]
+    for point in points[1:-1]:
+        dx = point[0] - thinned[-1][0]
+        dy = point[1] - thinned[-1][1]
+        if dx * dx + dy * dy > sq_tolerance:
+            thinned.append(point)
+    thinned.append(points[-1])
+
+    # Ramer-Douglas-Peucker
+    keep = [False] * len(thinned)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(thinned) - 1)]
+    while stack:
+        first, last = stack.pop()
+        x0, y0 = thinned[first]
+        x1, y1 = thinned[last]
+        dx = x1 - x0
+        dy = y1 - y0
+        sq_length = dx * dx + dy * dy
+        max_sq_dist = sq_tolerance
+        index = None
+        for i in range(first + 1, last):
+            x, y = thinned[i]
+            # distance to the segment, not to the infinite line, so that back-tracking points are kept
+            t = 0.0 if sq_length == 0 else ((x - x0) * dx + (y - y0) * dy) / sq_length
+            t = min(max(t, 0.0), 1.0)
+            sq_dist = (x - x0 - t * dx) ** 2 + (y - y0 - t * dy) ** 2
+            if sq_dist > max_sq_dist:
+                max_sq_dist = sq_dist
+                index = i
+        if index is not None:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(thinned, keep, strict=True) if kept]
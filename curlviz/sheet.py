@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 
 from . import consts
+from .geometry import simplify
 
 
 class Team(IntEnum):
@@ -46,6 +47,66 @@ class Stone:
         self.team = Team(self.team)
 
 
+@dataclass
+class Trajectory:
+    """A trajectory of a stone on the sheet
+
+    Attributes:
+        points (tuple[tuple[float, float], ...]): sequence of (x, y)-coordinates the stone passes through,
+            stored as an immutable tuple so that cached results cannot go stale; assign a new sequence to update it
+        team (Team): stone holder
+    """
+
+    points: tuple[tuple[float, float], ...] = field(default_factory=lambda: ())
+    team: Team = field(default=Team.Dummy)
+
+    def __setattr__(self, name, value) -> None:
+        if name == "points":
+            value = tuple((float(x), float(y)) for x, y in value)
+        super().__setattr__(name, value)
+
+    def __post_init__(self) -> None:
+        self.team = Team(self.team)
+        self._cache_points = None
+        self._cache = {}
+
+    def _cached(self, key, compute):
+        # the cache holds the points it was computed from, and is dropped when `points` is replaced
+        if self._cache_points is not self.points:
+            self._cache_points = self.points
+            self._cache = {}
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Returns the bounding box of the trajectory
+
+        The bounding box is given as `(x_min, y_min, x_max, y_max)` and is computed once per trajectory.
+
+        Exceptions:
+            This method raises a value error when the trajectory has no points.
+        """
+
+        def compute():
+            xs = [x for x, _ in self.points]
+            ys = [y for _, y in self.points]
+            return (min(xs), min(ys), max(xs), max(ys))
+
+        return self._cached("bounds", compute)
+
+    def simplified(self, tolerance: float) -> list[tuple[float, float]]:
+        """Returns the points simplified within the given tolerance
+
+        The result is computed once per tolerance, so that drawing the same trajectory repeatedly
+        does not depend on the raw number of points.
+
+        Arguments:
+            tolerance (float): maximum distance between the original and the simplified polyline
+        """
+        return self._cached(("simplified", tolerance), lambda: simplify(self.points, tolerance))
+
+
 @dataclass
 class Sheet:
     """Curling sheet
@@ -53,9 +114,11 @@ class Sheet:
     Attributes:
         config (Config): configuration of the sheet
         stones (List[Stone]): stones on the sheet
+        trajectories (List[Trajectory]): trajectories of stones on the sheet
     """
 
     stones: list[Stone] = field(default_factory=lambda: [])
+    trajectories: list[Trajectory] = field(default_factory=lambda: [])
 
     def put(self, stone: Stone) -> None:
         """Puts a stone on the sheet
@@ -73,6 +136,16 @@ class Sheet:
             raise RuntimeError("Too many stones on a sheet.")
         self.stones.append(stone)
 
+    def trace(self, trajectory: Trajectory) -> None:
+        """Adds a trajectory to the sheet
+
+        Arguments:
+            trajectory (Trajectory): the trajectory of a stone
+
+        Unlike stones, the number of trajectories on a sheet is not limited.
+        """
+        self.trajectories.append(trajectory)
+
     def count_stones(self) -> int:
         """Returns the number of stones on the sheet
 
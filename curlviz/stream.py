@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import cache
 from os import PathLike, makedirs, path
 from pathlib import PurePath
 
@@ -22,6 +24,187 @@ def _prepare(filepath: PathLike) -> PathLike:
     return filepath
 
 
+class Sink(ABC):
+    """Abstract output sink
+
+    A sink receives encoded files from streams and stores them somewhere, e.g. a directory or an archive.
+    Sinks can be used as context managers, which close the sink at the end.
+    """
+
+    @abstractmethod
+    def write(self, filepath: PathLike, data: bytes) -> None:
+        """Writes an encoded file
+
+        Arguments:
+            filepath (PathLike): path to the file
+            data (bytes): content of the file
+        """
+        ...
+
+    def close(self) -> None:
+        """Closes the sink"""
+        ...
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class DirectorySink(Sink):
+    """Directory sink
+
+    This sink writes each file into the file system, creating directories if required.
+    This is the default sink of streams.
+    """
+
+    def __init__(self, root: str = "") -> None:
+        """Initializes directory sink
+
+        Arguments:
+            root (str): directory relative file paths are resolved from (default: the current directory)
+        """
+        self.root = root
+
+    def write(self, filepath: PathLike, data: bytes) -> None:
+        filepath = _prepare(path.join(self.root, filepath))
+        with open(filepath, "wb") as fs:
+            fs.write(data)
+
+
+def _member_name(filepath: PathLike) -> str:
+    # archive members must not escape the extraction directory:
+    # absolute paths are made relative to the current directory, and leftover anchors and `..` are dropped
+    filepath = path.normpath(filepath)
+    if path.isabs(filepath):
+        relative = path.relpath(filepath)
+        if relative != path.pardir and not relative.startswith(path.pardir + path.sep):
+            filepath = relative
+    purepath = PurePath(filepath)
+    parts = [part for part in purepath.parts if part not in (purepath.anchor, path.pardir, path.curdir)]
+    if not parts:
+        raise ValueError(f"Invalid archive member name: {filepath}")
+    return PurePath(*parts).as_posix()
+
+
+class ZipSink(Sink):
+    """Zip sink
+
+    This sink writes all files sequentially into a single zip archive.
+    Files are stored without compression since the exported formats are compressed already.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """Initializes zip sink
+
+        Arguments:
+            filepath (str): path to the archive
+        """
+        import zipfile
+
+        self.filepath = _canonize(filepath, "zip")
+        self._archive = zipfile.ZipFile(_prepare(self.filepath), "w", zipfile.ZIP_STORED)
+
+    def write(self, filepath: PathLike, data: bytes) -> None:
+        self._archive.writestr(_member_name(filepath), data)
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+class TarSink(Sink):
+    """Tar sink
+
+    This sink writes all files sequentially into a single tar archive.
+    The archive is compressed with gzip if the file name ends with `.tar.gz` or `.tgz`.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """Initializes tar sink
+
+        Arguments:
+            filepath (str): path to the archive
+        """
+        import tarfile
+
+        if filepath.endswith((".tar.gz", ".tgz")):
+            mode = "w|gz"
+            self.filepath = PurePath(filepath)
+        else:
+            mode = "w|"
+            self.filepath = _canonize(filepath, "tar")
+        self._archive = tarfile.open(_prepare(self.filepath), mode)
+
+    def write(self, filepath: PathLike, data: bytes) -> None:
+        import io
+        import tarfile
+        import time
+
+        info = tarfile.TarInfo(_member_name(filepath))
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._archive.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def archive(filepath: str) -> Sink:
+    """Returns an archive sink for the given file
+
+    The archive format is determined by the extension: `.zip`, `.tar`, `.tar.gz` or `.tgz`.
+
+    Arguments:
+        filepath (str): path to the archive
+
+    Exceptions:
+        This function raises a runtime error for unknown extensions.
+    """
+    if filepath.endswith(".zip"):
+        return ZipSink(filepath)
+    if filepath.endswith((".tar", ".tar.gz", ".tgz")):
+        return TarSink(filepath)
+    raise RuntimeError(f"Unknown archive format: {filepath}")
+
+
+@cache
+def _warn_svg_lines() -> None:
+    # printed once per process, so that batch exports do not flood stderr
+    import sys
+
+    print("[Warning] Lines will be disappeared in SVG format.", file=sys.stderr)
+
+
+def _encode_pdf(size: tuple[int, int], draw: Callable) -> bytes:
+    import skia
+
+    stream = skia.DynamicMemoryWStream()
+    with skia.PDF.MakeDocument(stream) as document:
+        with document.page(*size) as canvas:
+            draw(canvas)
+    return bytes(stream.detachAsData())
+
+
+def _encode_svg(size: tuple[int, int], draw: Callable) -> bytes:
+    import skia
+
+    stream = skia.DynamicMemoryWStream()
+    canvas = skia.SVGCanvas.Make(size, stream)
+    draw(canvas)
+    del canvas
+    return bytes(stream.detachAsData())
+
+
+def _encode_png(size: tuple[int, int], draw: Callable) -> bytes:
+    import skia
+
+    surface = skia.Surface(*size)
+    with surface as canvas:
+        draw(canvas)
+    return bytes(surface.makeImageSnapshot().encodeToData(skia.kPNG, 100))
+
+
 class Stream(ABC):
     """Abstract stream to export a sheet image
 
@@ -55,15 +238,17 @@ class PDF(Stream):
     The exported file is a single page PDF file.
     """
 
-    def __init__(self, filepath: str, config: Config = Config()) -> None:
+    def __init__(self, filepath: str, config: Config = Config(), sink: Sink | None = None) -> None:
         """Initializes PDF stream
 
         Arguments:
             filepath (str): path to the exported file
             config (curlviz.Config): exporting configuration
+            sink (Sink | None): output sink (default: `DirectorySink()`)
         """
         super().__init__(config)
         self.filepath = _canonize(filepath, "pdf")
+        self.sink = DirectorySink() if sink is None else sink
 
     def export(self, sheet: Sheet) -> None:
         """Exports a PDF file
@@ -71,15 +256,87 @@ class PDF(Stream):
         Arguments:
             sheet (curlviz.Sheet): the sheet to be drawn
         """
+        drawer = Drawer(self.config)
+        data = _encode_pdf(drawer.canvas_size(), lambda canvas: drawer.draw(canvas, sheet))
+        self.sink.write(self.filepath, data)
+
+
+class MultiPagePDF(Stream):
+    """Multi-page PDF stream
+
+    This stream keeps a PDF document open and appends one page per exported sheet.
+    Each page is written to the file as soon as it is exported,
+    so the memory usage does not grow with the number of pages.
+
+    The stream must be opened before exporting, typically as a context manager:
+
+        with curlviz.stream.MultiPagePDF("report.pdf") as stream:
+            for sheet in sheets:
+                stream.export(sheet)
+    """
+
+    def __init__(self, filepath: str, config: Config = Config()) -> None:
+        """Initializes multi-page PDF stream
+
+        Arguments:
+            filepath (str): path to the exported file
+            config (curlviz.Config): exporting configuration
+        """
+        super().__init__(config)
+        self.filepath = _canonize(filepath, "pdf")
+        self._stream = None
+        self._document = None
+
+    def open(self) -> None:
+        """Opens the PDF document
+
+        Exceptions:
+            This method raises a runtime error when the stream is already opened.
+        """
         import skia
 
+        if self._document is not None:
+            raise RuntimeError("PDF stream is already opened.")
         filepath = _prepare(self.filepath)
-        stream = skia.FILEWStream(filepath)
-        with skia.PDF.MakeDocument(stream) as document:
-            drawer = Drawer(self.config)
-            width, height = drawer.canvas_size()
-            with document.page(width, height) as canvas:
-                drawer.draw(canvas, sheet)
+        self._stream = skia.FILEWStream(filepath)
+        self._document = skia.PDF.MakeDocument(self._stream)
+
+    def close(self) -> None:
+        """Closes the PDF document
+
+        This method finalizes the document. Closing a stream that is not opened has no effect.
+        """
+        if self._document is None:
+            return
+        self._document.close()
+        self._stream.flush()
+        self._document = None
+        self._stream = None
+
+    def __enter__(self) -> "MultiPagePDF":
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def export(self, sheet: Sheet) -> None:
+        """Appends a page to the PDF file
+
+        Arguments:
+            sheet (curlviz.Sheet): the sheet to be drawn
+
+        Exceptions:
+            This method raises a runtime error when the stream is not opened.
+        """
+        if self._document is None:
+            raise RuntimeError("PDF stream is not opened.")
+        drawer = Drawer(self.config)
+        width, height = drawer.canvas_size()
+        canvas = self._document.beginPage(width, height)
+        drawer.draw(canvas, sheet)
+        self._document.endPage()
+        self._stream.flush()
 
 
 class SVG(Stream):
@@ -88,18 +345,18 @@ class SVG(Stream):
     This stream exports the sheet image in SVG format.
     """
 
-    def __init__(self, filepath: str, config: Config = Config()) -> None:
+    def __init__(self, filepath: str, config: Config = Config(), sink: Sink | None = None) -> None:
         """Initializes SVG stream
 
         Arguments:
             filepath (str): path to the exported file
             config (curlviz.Config): exporting configuration
+            sink (Sink | None): output sink (default: `DirectorySink()`)
         """
-        import sys
-
         super().__init__(config)
         self.filepath = _canonize(filepath, "svg")
-        print("[Warning] Lines will be disappeared in SVG format.", file=sys.stderr)
+        self.sink = DirectorySink() if sink is None else sink
+        _warn_svg_lines()
 
     def export(self, sheet: Sheet) -> None:
         """Exports a SVG file
@@ -107,15 +364,9 @@ class SVG(Stream):
         Arguments:
             sheet (curlviz.Sheet): the sheet to be drawn
         """
-        import skia
-
         drawer = Drawer(self.config)
-        filepath = _prepare(self.filepath)
-        stream = skia.FILEWStream(filepath)
-        canvas = skia.SVGCanvas.Make(drawer.canvas_size(), stream)
-        drawer.draw(canvas, sheet)
-        del canvas
-        stream.flush()
+        data = _encode_svg(drawer.canvas_size(), lambda canvas: drawer.draw(canvas, sheet))
+        self.sink.write(self.filepath, data)
 
 
 class PNG(Stream):
@@ -125,29 +376,92 @@ class PNG(Stream):
     Use this stream for exporting a raster image.
     """
 
-    def __init__(self, filepath: str, config: Config = Config()) -> None:
+    def __init__(self, filepath: str, config: Config = Config(), sink: Sink | None = None) -> None:
         """Initializes PNG stream
 
         Arguments:
             filepath (str): path to the exported file
             config (curlviz.Config): exporting configuration
+            sink (Sink | None): output sink (default: `DirectorySink()`)
         """
         super().__init__(config)
         self.filepath = _canonize(filepath, "png")
+        self.sink = DirectorySink() if sink is None else sink
 
     def export(self, sheet: Sheet) -> None:
         """Exports a PNG file
 
+        Arguments:
+            sheet (curlviz.Sheet): the sheet to be drawn
+        """
+        drawer = Drawer(self.config)
+        data = _encode_png(drawer.canvas_size(), lambda canvas: drawer.draw(canvas, sheet))
+        self.sink.write(self.filepath, data)
+
+
+_ENCODERS: dict[str, Callable] = {
+    "pdf": _encode_pdf,
+    "svg": _encode_svg,
+    "png": _encode_png,
+}
+
+
+class MultiFormat(Stream):
+    """Multi-format stream
+
+    This stream exports the sheet image in several formats at once.
+    The sheet is drawn only once into a resolution-independent picture,
+    which is then played back into each format.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        config: Config = Config(),
+        sink: Sink | None = None,
+        *,
+        formats: tuple[str, ...] = ("pdf", "svg", "png"),
+    ) -> None:
+        """Initializes multi-format stream
+
+        Arguments:
+            filepath (str): path to the exported files without extension, the extension of each format is appended
+            config (curlviz.Config): exporting configuration
+            sink (Sink | None): output sink (default: `DirectorySink()`)
+            formats (tuple[str, ...]): formats to be exported from `"pdf"`, `"svg"` and `"png"` (default: all of them)
+
+        Exceptions:
+            This method raises a type error when `formats` is a single string,
+            and a runtime error for unknown formats.
+        """
+        super().__init__(config)
+        if isinstance(formats, str):
+            raise TypeError(f"Formats must be a collection of format names, but got a string '{formats}'.")
+        for format in formats:
+            if format not in _ENCODERS:
+                raise RuntimeError(f"Unknown target: {format}")
+        base, ext = path.splitext(filepath)
+        if ext[1:] in _ENCODERS:
+            filepath = base
+        self.filepaths = {format: _canonize(filepath, format) for format in formats}
+        self.sink = DirectorySink() if sink is None else sink
+        if "svg" in formats:
+            _warn_svg_lines()
+
+    def export(self, sheet: Sheet) -> None:
+        """Exports a file per format
+
         Arguments:
             sheet (curlviz.Sheet): the sheet to be drawn
         """
         import skia
 
         drawer = Drawer(self.config)
-        surface = skia.Surface(*drawer.canvas_size())
-        with surface as canvas:
-            drawer.draw(canvas, sheet)
-        image = surface.makeImageSnapshot()
-
-        filepath = _prepare(self.filepath)
-        image.save(filepath, skia.kPNG)
+        width, height = drawer.canvas_size()
+        recorder = skia.PictureRecorder()
+        drawer.draw(recorder.beginRecording(skia.Rect(0, 0, width, height)), sheet)
+        picture = recorder.finishRecordingAsPicture()
+
+        for format, filepath in self.filepaths.items():
+            data = _ENCODERS[format]((width, height), lambda canvas: canvas.drawPicture(picture))
+            self.sink.write(filepath, data)
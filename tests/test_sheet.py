@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("skia")
+
+from curlviz import Trajectory  # noqa: E402
+
+
+def test_points_are_immutable():
+    trajectory = Trajectory(points=[(0, 0), (1, 1), (2, 0)], team=0)
+    assert trajectory.points == ((0.0, 0.0), (1.0, 1.0), (2.0, 0.0))
+    with pytest.raises(TypeError):
+        trajectory.points[1] = (5.0, 5.0)
+
+
+def test_cache_is_dropped_on_replacement():
+    trajectory = Trajectory(points=[(0, 0), (1, 1), (2, 0)], team=0)
+    assert trajectory.bounds() == (0.0, 0.0, 2.0, 1.0)
+    assert trajectory.simplified(0.1) == [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]
+
+    trajectory.points = [(0, 0), (5, 5), (2, 0)]
+    assert trajectory.bounds() == (0.0, 0.0, 5.0, 5.0)
+    assert trajectory.simplified(0.1) == [(0.0, 0.0), (5.0, 5.0), (2.0, 0.0)]
+
+
+def test_cache_is_dropped_on_replacement_with_reused_ids():
+    trajectory = Trajectory(team=0)
+    for i in range(1000):
+        trajectory.points = [(0, 0), (1, i)]
+        assert trajectory.bounds() == (0.0, 0.0, 1.0, float(i))
+        trajectory.points = [(0, 0), (2, i)]
+        trajectory.points = [(0, 0), (3, i)]
+        assert trajectory.bounds() == (0.0, 0.0, 3.0, float(i))
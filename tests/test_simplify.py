@@ -0,0 +1,51 @@
+import math
+import random
+
+import pytest
+
+pytest.importorskip("skia")
+
+from curlviz.geometry import simplify  # noqa: E402
+
+
+def distance_to_polyline(point, polyline):
+    x, y = point
+    best = math.inf
+    for (x0, y0), (x1, y1) in zip(polyline, polyline[1:]):
+        dx = x1 - x0
+        dy = y1 - y0
+        sq_length = dx * dx + dy * dy
+        t = 0.0 if sq_length == 0 else ((x - x0) * dx + (y - y0) * dy) / sq_length
+        t = min(max(t, 0.0), 1.0)
+        best = min(best, math.hypot(x - x0 - t * dx, y - y0 - t * dy))
+    return best
+
+
+def noisy_curve(n):
+    rng = random.Random(0)
+    return [
+        (0.5 * math.sin(i / 200) + rng.uniform(-0.05, 0.05), i / 50 + rng.uniform(-0.05, 0.05))
+        for i in range(n)
+    ]
+
+
+def test_end_points_are_kept():
+    points = noisy_curve(2000)
+    simplified = simplify(points, 0.1)
+    assert simplified[0] == points[0]
+    assert simplified[-1] == points[-1]
+    assert len(simplified) < len(points)
+
+
+@pytest.mark.parametrize("tolerance", [0.01, 0.05, 0.1, 0.5])
+def test_error_is_bounded_by_tolerance(tolerance):
+    points = noisy_curve(2000)
+    simplified = simplify(points, tolerance)
+    assert max(distance_to_polyline(p, simplified) for p in points) <= tolerance
+
+
+def test_back_tracking_is_kept():
+    points = [(0.0, 0.0), (1.0, 0.0), (1.04, 0.0), (0.5, 0.0)]
+    simplified = simplify(points, 0.1)
+    assert max(x for x, _ in simplified) >= 1.04 - 0.1
+    assert max(distance_to_polyline(p, simplified) for p in points) <= 0.1